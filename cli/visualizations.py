@@ -3,8 +3,12 @@ from typing import Optional, Dict
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.live import Live
+from itertools import islice
+from concurrent.futures import Future
 import sys
 import os
+import types
 
 # Add parent directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,6 +18,26 @@ from visualize_dada.chart_generator import ChartGenerator
 
 console = Console()
 
+# Maximum rows per results table; larger result sets are split across tables
+# so Rich never has to lay out one giant table
+TABLE_CHUNK_SIZE = 100
+
+_INTERVAL_DESCRIPTIONS = types.MappingProxyType({
+    '1m': 'One minute intervals',
+    '2m': 'Two minute intervals',
+    '5m': 'Five minute intervals',
+    '15m': 'Fifteen minute intervals',
+    '30m': 'Thirty minute intervals',
+    '60m': 'Hourly intervals',
+    '90m': 'Ninety minute intervals',
+    '1h': 'Hourly intervals',
+    '1d': 'Daily intervals',
+    '5d': 'Five day intervals',
+    '1wk': 'Weekly intervals',
+    '1mo': 'Monthly intervals',
+    '3mo': 'Quarterly intervals'
+})
+
 class VisualizationManager:
     def __init__(self):
         self.chart_generator = ChartGenerator()
@@ -43,37 +67,65 @@ class VisualizationManager:
         console.print(Panel(summary, title="Summary", border_style="cyan"))
 
     def _display_detailed_results(self, results: Dict, generate_charts: bool):
-        """Display detailed results table"""
+        """Display detailed results tables, streaming rows as they are processed"""
+        console.print("\n")
+        
+        chart_requests = {}
+        if generate_charts:
+            chart_requests = {
+                ticker: (result['data'], result['paths']['ticker_dir'])
+                for ticker, result in results.items()
+                if result['status'] == 'success'
+            }
+        
+        with self.chart_generator.chart_jobs(chart_requests) as chart_jobs:
+            self._display_result_tables(results, chart_jobs)
+
+    def _display_result_tables(self, results: Dict, chart_jobs: Dict[str, Future]):
+        """Display results in tables of at most TABLE_CHUNK_SIZE rows"""
+        items = iter(results.items())
+        chunk_count = (len(results) + TABLE_CHUNK_SIZE - 1) // TABLE_CHUNK_SIZE
+        for chunk_index in range(chunk_count):
+            title = "Data Collection Results"
+            if chunk_count > 1:
+                first = chunk_index * TABLE_CHUNK_SIZE + 1
+                last = min(first + TABLE_CHUNK_SIZE - 1, len(results))
+                title = f"{title} ({first}-{last} of {len(results)})"
+            
+            table = self._create_results_table(title)
+            with Live(table, console=console, refresh_per_second=4) as live:
+                for ticker, result in islice(items, TABLE_CHUNK_SIZE):
+                    if result['status'] == 'success':
+                        self._add_success_row(table, ticker, result, chart_jobs.get(ticker))
+                    else:
+                        self._add_error_row(table, ticker, result)
+                    live.update(table)
+
+    def _create_results_table(self, title: str) -> Table:
+        """Create an empty results table"""
         table = Table(
-            title="Data Collection Results",
+            title=title,
             show_header=True,
             header_style="bold cyan"
         )
         table.add_column("Ticker", style="cyan")
         table.add_column("Status", style="green")
         table.add_column("Files Generated", style="yellow")
-        
-        for ticker, result in results.items():
-            if result['status'] == 'success':
-                self._add_success_row(table, ticker, result, generate_charts)
-            else:
-                self._add_error_row(table, ticker, result)
-        
-        console.print("\n")
-        console.print(table)
+        return table
 
-    def _add_success_row(self, table: Table, ticker: str, result: Dict, generate_charts: bool):
-        """Add a success row to the results table"""
-        data = result['data']
+    def _add_success_row(
+        self,
+        table: Table,
+        ticker: str,
+        result: Dict,
+        chart_job: Optional[Future] = None
+    ):
+        """Add a success row to the results table, waiting on its chart job if any"""
         paths = result['paths']
         
-        if generate_charts:
+        if chart_job is not None:
             try:
-                charts = self.chart_generator.generate_all_charts(
-                    data,
-                    ticker,
-                    paths['ticker_dir']
-                )
+                charts = chart_job.result()
                 files = [
                     f"Data: {paths['data_path'].name}",
                     f"Charts: {', '.join(f'{k}.html' for k in charts.keys())}"
@@ -115,27 +167,11 @@ class VisualizationManager:
         table.add_column("Period Available", style="green")
         table.add_column("Description", style="yellow")
         
-        descriptions = {
-            '1m': 'One minute intervals',
-            '2m': 'Two minute intervals',
-            '5m': 'Five minute intervals',
-            '15m': 'Fifteen minute intervals',
-            '30m': 'Thirty minute intervals',
-            '60m': 'Hourly intervals',
-            '90m': 'Ninety minute intervals',
-            '1h': 'Hourly intervals',
-            '1d': 'Daily intervals',
-            '5d': 'Five day intervals',
-            '1wk': 'Weekly intervals',
-            '1mo': 'Monthly intervals',
-            '3mo': 'Quarterly intervals'
-        }
-        
         for interval, period in fetcher.supported_intervals.items():
             table.add_row(
                 interval,
                 period,
-                descriptions.get(interval, '')
+                _INTERVAL_DESCRIPTIONS.get(interval, '')
             )
         
         console.print("\n")
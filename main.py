@@ -1,12 +1,12 @@
 import typer
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Union
 from rich.console import Console
 from rich.table import Table
 import sys
+import functools
 from datetime import datetime, timedelta
 import questionary
-from dateutil import parser
 from dateutil.relativedelta import relativedelta
 
 from pull_dada.y_finance.data_fetcher import YFinanceDataFetcher
@@ -15,6 +15,17 @@ from cli.visualizations import VisualizationManager
 app = typer.Typer(no_args_is_help=False)
 console = Console()
 
+# Offsets from the end date for each preset date range
+_RANGE_DELTAS: Dict[str, Union[timedelta, relativedelta]] = {
+    "Last 7 days": timedelta(days=7),
+    "Last 30 days": timedelta(days=30),
+    "Last 60 days": timedelta(days=60),
+    "Last 3 months": relativedelta(months=3),
+    "Last 6 months": relativedelta(months=6),
+    "Last 1 year": relativedelta(years=1),
+    "Last 5 years": relativedelta(years=5)
+}
+
 def get_data_directory() -> Path:
     """Create and return the data directory with timestamp"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -22,8 +33,9 @@ def get_data_directory() -> Path:
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
+@functools.lru_cache(maxsize=1)
 def read_ticker_file() -> List[str]:
-    """Read tickers from input_tickers.txt file"""
+    """Read tickers from input_tickers.txt file (parsed once per process)"""
     ticker_file = Path("input_tickers") / "input_tickers.txt"
     tickers = []
     
@@ -41,11 +53,10 @@ def read_ticker_file() -> List[str]:
 
 def check_input_file() -> bool:
     """Check if input tickers file exists and has valid content"""
-    ticker_file = Path("input_tickers") / "input_tickers.txt"
-    if ticker_file.exists():
-        tickers = read_ticker_file()
-        return len(tickers) > 0
-    return False
+    try:
+        return len(read_ticker_file()) > 0
+    except FileNotFoundError:
+        return False
 
 def get_tickers() -> str:
     """Get tickers from file or manual input"""
@@ -175,33 +186,23 @@ def get_date_range(interval: str) -> Tuple[str, str]:
             validate=lambda text: not text or bool(try_parse_date(text))
         ).ask()
         
-        start_date = parser.parse(start_date_str)
-        end_date = parser.parse(end_date_str) if end_date_str else end_date
+        start_date = try_parse_date(start_date_str)
+        end_date = try_parse_date(end_date_str) if end_date_str else end_date
         
     else:
         # Calculate start date based on selection
-        if range_choice == "Last 7 days":
-            start_date = end_date - timedelta(days=7)
-        elif range_choice == "Last 30 days":
-            start_date = end_date - timedelta(days=30)
-        elif range_choice == "Last 3 months":
-            start_date = end_date - relativedelta(months=3)
-        elif range_choice == "Last 6 months":
-            start_date = end_date - relativedelta(months=6)
-        elif range_choice == "Last 1 year":
-            start_date = end_date - relativedelta(years=1)
-        elif range_choice == "Last 5 years":
-            start_date = end_date - relativedelta(years=5)
-        else:
+        delta = _RANGE_DELTAS.get(range_choice)
+        if delta is None:
             return None, None
+        start_date = end_date - delta
     
     return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
 
 def try_parse_date(date_str: str) -> Optional[datetime]:
-    """Try to parse a date string"""
+    """Try to parse a YYYY-MM-DD date string"""
     try:
-        return parser.parse(date_str)
-    except:
+        return datetime.fromisoformat(date_str.strip())
+    except ValueError:
         return None
 
 def get_user_inputs() -> Tuple[str, str, Tuple[str, str], bool]:
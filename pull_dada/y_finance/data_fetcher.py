@@ -1,11 +1,19 @@
 import yfinance as yf
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime, timedelta
 import os
+import re
 from pathlib import Path
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB, to keep the number of write syscalls low
+_TICKER_RE = re.compile(r'[^,\s]+')  # Anything between commas/whitespace is a ticker
+
 class YFinanceDataFetcher:
     def __init__(self):
         self.supported_intervals = {
@@ -23,16 +31,47 @@ class YFinanceDataFetcher:
             '1mo': 'max',
             '3mo': 'max'
         }
-        self.last_request_time = None
-        self.min_request_interval = 0.5  # Minimum time between requests in seconds
+        self.min_request_interval = 0.5  # Average time between requests in seconds
+        self.max_burst = 4  # Requests allowed back to back before throttling kicks in
+        
+        # Token bucket: each request takes a token, and tokens are refilled from
+        # the elapsed time at one per min_request_interval, up to max_burst
+        self._tokens = float(self.max_burst)
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
 
     def _rate_limit(self):
         """Implement rate limiting between requests"""
-        if self.last_request_time is not None:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.min_request_interval:
-                time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_burst,
+                self._tokens + (now - self._last_refill) / self.min_request_interval
+            )
+            self._last_refill = now
+            
+            # Reserve a token even if the bucket is empty, then wait outside the
+            # lock until it would have been refilled
+            self._tokens -= 1
+            wait = -self._tokens * self.min_request_interval if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+    def _adjust_start_date(self, interval: str, start_date: str, end_date: str) -> str:
+        """Clamp the start date to the maximum history available for intraday intervals"""
+        # For minute-level data, ensure we don't exceed the maximum period
+        if interval in ['1m', '2m', '5m', '15m', '30m', '60m', '1h']:
+            start = datetime.fromisoformat(start_date)
+            end = datetime.fromisoformat(end_date)
+            max_days = 7 if interval == '1m' else 60
+            
+            # If requested period exceeds limit, adjust start date
+            if (end - start).days > max_days:
+                start_date = (end - timedelta(days=max_days)).strftime("%Y-%m-%d")
+                print(f"Note: Adjusted start date to {start_date} due to {interval} interval limitations")
+        
+        return start_date
 
     def fetch_data(
         self, 
@@ -59,17 +98,7 @@ class YFinanceDataFetcher:
             
             # Handle date range based on interval limitations
             if start_date and end_date:
-                # For minute-level data, ensure we don't exceed the maximum period
-                if interval in ['1m', '2m', '5m', '15m', '30m', '60m', '1h']:
-                    start = datetime.strptime(start_date, "%Y-%m-%d")
-                    end = datetime.strptime(end_date, "%Y-%m-%d")
-                    max_days = 7 if interval == '1m' else 60
-                    
-                    # If requested period exceeds limit, adjust start date
-                    if (end - start).days > max_days:
-                        start_date = (end - timedelta(days=max_days)).strftime("%Y-%m-%d")
-                        print(f"Note: Adjusted start date to {start_date} due to {interval} interval limitations")
-                
+                start_date = self._adjust_start_date(interval, start_date, end_date)
                 data = stock.history(
                     start=start_date,
                     end=end_date,
@@ -107,16 +136,78 @@ class YFinanceDataFetcher:
         # Save data file
         file_name = f"{ticker}_{interval}.csv"
         data_path = data_dir / file_name
-        data.to_csv(data_path)
+        with open(data_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            self._write_csv(data, f)
         
         return {
             'ticker_dir': ticker_dir,
             'data_path': data_path
         }
 
+    def _write_csv(self, data: pd.DataFrame, f):
+        """
+        Write data as CSV in the layout of DataFrame.to_csv, using Arrow's C++
+        writer for the numeric body (floats are written in shortest form, e.g. 1
+        rather than 1.0)
+        """
+        numeric = all(
+            pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype)
+            for dtype in data.dtypes
+        )
+        if not numeric or not isinstance(data.index, pd.DatetimeIndex):
+            # Values that may need quoting go through pandas
+            data.to_csv(f)
+            return
+        
+        # Arrow always quotes header names, so let pandas write the header row, and
+        # format the index the way to_csv does instead of Arrow's UTC timestamps
+        f.write(data.iloc[:0].to_csv(lineterminator='\n').encode('utf-8'))
+        body = data.reset_index(drop=True)
+        body.insert(0, '__index__', data.index.astype(str))
+        table = pa.Table.from_pandas(body, preserve_index=False)
+        pacsv.write_csv(
+            table,
+            f,
+            write_options=pacsv.WriteOptions(include_header=False, quoting_style='none')
+        )
+
+    def fetch_multiple(
+        self,
+        tickers: List[str],
+        interval: str = '1d',
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch data for several tickers concurrently
+        Args:
+            tickers: List of stock symbols
+            interval: Data interval (e.g., '1d', '1h', '5m')
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+        Returns:
+            Dictionary mapping each ticker to its data, or None if nothing was returned
+        """
+        if interval not in self.supported_intervals:
+            raise ValueError(f"Unsupported interval: {interval}")
+        
+        # Clamp once up front so the note isn't printed for every ticker
+        if start_date and end_date:
+            start_date = self._adjust_start_date(interval, start_date, end_date)
+        
+        # Each ticker goes through the same Ticker.history call as fetch_data, so
+        # frames keep their exchange timezone and column dtypes; the requests are
+        # network-bound, so threads overlap them
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                ticker: executor.submit(self.fetch_data, ticker, interval, start_date, end_date)
+                for ticker in tickers
+            }
+            return {ticker: future.result() for ticker, future in futures.items()}
+
     def process_tickers(self, ticker_input: str) -> List[str]:
         """Process comma-separated ticker input"""
-        return [t.strip().upper() for t in ticker_input.split(',') if t.strip()]
+        return [ticker.upper() for ticker in _TICKER_RE.findall(ticker_input)]
 
     def fetch_and_save_multiple(
         self, 
@@ -140,17 +231,34 @@ class YFinanceDataFetcher:
         tickers = self.process_tickers(ticker_input)
         results = {}
         
-        for ticker in tickers:
-            print(f"Fetching data for {ticker}...")
-            data = self.fetch_data(ticker, interval, start_date, end_date)
+        if not tickers:
+            return results
+        
+        print(f"Fetching data for {', '.join(tickers)}...")
+        frames = self.fetch_multiple(tickers, interval, start_date, end_date)
+        
+        # CSV writing is I/O-bound, so save the per-ticker frames concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                ticker: executor.submit(self.save_data, data, ticker, base_dir, interval)
+                for ticker, data in frames.items()
+                if data is not None
+            }
             
-            if data is not None:
+            for ticker in tickers:
+                if ticker not in futures:
+                    results[ticker] = {
+                        'status': 'error',
+                        'message': f"Failed to fetch data"
+                    }
+                    continue
+                
                 try:
-                    paths = self.save_data(data, ticker, base_dir, interval)
+                    paths = futures[ticker].result()
                     results[ticker] = {
                         'status': 'success',
                         'paths': paths,
-                        'data': data
+                        'data': frames[ticker]
                     }
                     print(f"Successfully saved data for {ticker}")
                 except Exception as e:
@@ -158,10 +266,5 @@ class YFinanceDataFetcher:
                         'status': 'error',
                         'message': f"Error saving data: {str(e)}"
                     }
-            else:
-                results[ticker] = {
-                    'status': 'error',
-                    'message': f"Failed to fetch data"
-                }
         
-        return results 
\ No newline at end of file
+        return results
@@ -1,11 +1,33 @@
+import contextlib
+import copy
+import hashlib
+import json
+import os
+import shutil
+import bottleneck as bn
+import plotly
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+# Serialize figures with orjson, which encodes NumPy arrays much faster than stdlib json
+pio.json.config.default_engine = 'orjson'
+
+# Chart cache index shared by every run, next to the timestamped run directories
+CACHE_INDEX_PATH = Path("data") / ".chart_cache.json"
+# Bump whenever chart rendering changes so cached charts from older code are not reused
+CHART_CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 500  # Least recently used entries beyond this are dropped
+DEFAULT_MA_PERIODS = (20, 50, 200)
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB, to keep the number of write syscalls low
 
 class ChartGenerator:
-    def __init__(self):
+    def __init__(self, cache_index_path: Path = CACHE_INDEX_PATH):
         self.default_layout = {
             'template': 'plotly_dark',
             'title_x': 0.5,
@@ -13,6 +35,99 @@ class ChartGenerator:
             'height': 800,
             'margin': dict(t=100, l=50, r=50, b=50)
         }
+        self.cache_index_path = cache_index_path
+        # Generated chart paths keyed by "TICKER:digest", loaded lazily from the index
+        self._cache: Optional[Dict[str, Dict[str, Path]]] = None
+
+    def cache_key(
+        self,
+        data: pd.DataFrame,
+        ticker: str,
+        ma_periods: tuple = DEFAULT_MA_PERIODS
+    ) -> str:
+        """Build a cache key from the ticker, the data contents and the rendering setup"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        digest.update(json.dumps([
+            [str(column) for column in data.columns],
+            CHART_CACHE_VERSION,
+            plotly.__version__,
+            list(ma_periods)
+        ]).encode('utf-8'))
+        return f"{ticker}:{digest.hexdigest()}"
+
+    def _load_cache_index(self) -> Dict[str, Dict[str, Path]]:
+        """Load the chart cache index written by earlier runs"""
+        if self._cache is None:
+            try:
+                with open(self.cache_index_path, 'r') as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = {}
+            
+            # Paths are stored relative to the index file
+            base_dir = self.cache_index_path.parent
+            self._cache = {
+                key: {chart_type: base_dir / path for chart_type, path in charts.items()}
+                for key, charts in index.items()
+            } if isinstance(index, dict) else {}
+        return self._cache
+
+    def load_cached_charts(self, key: str, ticker_dir: Path) -> Optional[Dict[str, Path]]:
+        """
+        Return cached charts for the key in ticker_dir, copying them over from
+        an earlier run if needed; None if there is nothing usable
+        """
+        charts = self._load_cache_index().get(key)
+        if not charts or not all(path.exists() for path in charts.values()):
+            return None
+        
+        charts_dir = ticker_dir / "charts"
+        copied = {}
+        try:
+            for chart_type, path in charts.items():
+                target = charts_dir / path.name
+                if not target.exists() or not target.samefile(path):
+                    charts_dir.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(path, target)
+                copied[chart_type] = target
+        except OSError:
+            return None
+        return copied
+
+    def cache_charts(self, key: str, charts: Dict[str, Path]):
+        """Record the latest location of the charts for the key"""
+        cache = self._load_cache_index()
+        # Re-insert so the dict order runs from least to most recently used
+        cache.pop(key, None)
+        cache[key] = charts
+
+    def save_cache_index(self):
+        """
+        Persist the chart cache index, dropping entries whose files are gone and
+        keeping only the MAX_CACHE_ENTRIES most recently used
+        """
+        base_dir = self.cache_index_path.parent
+        entries = [
+            (key, charts)
+            for key, charts in self._load_cache_index().items()
+            if all(path.exists() for path in charts.values())
+        ][-MAX_CACHE_ENTRIES:]
+        self._cache = dict(entries)
+        index = {
+            key: {
+                chart_type: Path(os.path.relpath(path, base_dir)).as_posix()
+                for chart_type, path in charts.items()
+            }
+            for key, charts in entries
+        }
+        
+        # Write to a temporary file first so a crash can't leave a truncated index
+        base_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_index_path.with_name(self.cache_index_path.name + '.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(temp_path, self.cache_index_path)
 
     def create_candlestick_chart(
         self, 
@@ -46,15 +161,22 @@ class ChartGenerator:
 
         # Add volume bar chart
         if include_volume and 'Volume' in data.columns:
-            colors = ['red' if close < open else 'green' 
-                     for close, open in zip(data['Close'], data['Open'])]
+            # 1 for up bars, 0 for down bars; a compact byte array instead of color strings.
+            # Negating close < open keeps bars with a missing price green
+            up_mask = (~(data['Close'].to_numpy() < data['Open'].to_numpy())).astype(np.uint8)
             
             fig.add_trace(
                 go.Bar(
                     x=data.index,
                     y=data['Volume'],
                     name='Volume',
-                    marker_color=colors,
+                    marker=dict(
+                        color=up_mask,
+                        colorscale=[[0, 'red'], [1, 'green']],
+                        cmin=0,
+                        cmax=1,
+                        showscale=False
+                    ),
                     opacity=0.5
                 ),
                 row=2, col=1
@@ -74,21 +196,32 @@ class ChartGenerator:
         self, 
         data: pd.DataFrame, 
         ticker: str,
-        ma_periods: list = [20, 50, 200]
+        ma_periods: tuple = DEFAULT_MA_PERIODS,
+        fig: Optional[go.Figure] = None
     ) -> go.Figure:
-        """Create a technical analysis chart with moving averages"""
-        # Calculate moving averages
-        for period in ma_periods:
-            data[f'MA{period}'] = data['Close'].rolling(window=period).mean()
+        """
+        Create a technical analysis chart with moving averages
+        Args:
+            fig: Existing candlestick chart to draw the moving averages on;
+                a new one is created when omitted
+        """
+        # Calculate moving averages without writing them back to the caller's data
+        close = data['Close'].to_numpy(dtype=float)
+        mas = {
+            period: bn.move_mean(close, window=period)
+            if period <= len(close) else np.full(len(close), np.nan)
+            for period in ma_periods
+        }
 
-        fig = self.create_candlestick_chart(data, ticker)
+        if fig is None:
+            fig = self.create_candlestick_chart(data, ticker)
 
         # Add moving averages
         for period in ma_periods:
             fig.add_trace(
                 go.Scatter(
                     x=data.index,
-                    y=data[f'MA{period}'],
+                    y=mas[period],
                     name=f'{period}-day MA',
                     line=dict(width=1)
                 ),
@@ -109,16 +242,81 @@ class ChartGenerator:
         charts_dir.mkdir(parents=True, exist_ok=True)
         
         file_path = charts_dir / f"{ticker}_{chart_type}.html"
-        fig.write_html(str(file_path))
+        # Reference plotly.js from the CDN instead of embedding the bundle in every file
+        html = fig.to_html(
+            include_plotlyjs='cdn',
+            full_html=True,
+            config={'responsive': True}
+        )
+        with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(html.encode('utf-8'))
         return file_path
 
-    def generate_all_charts(
+    @contextlib.contextmanager
+    def chart_jobs(
+        self,
+        requests: Dict[str, Tuple[pd.DataFrame, Path]],
+        ma_periods: tuple = DEFAULT_MA_PERIODS
+    ) -> Iterator[Dict[str, Future]]:
+        """
+        Generate and save all chart types for each ticker, reusing unchanged charts
+        Args:
+            requests: Mapping of ticker to its (data, ticker_dir)
+            ma_periods: Moving average periods for the technical chart
+        Yields:
+            Mapping of ticker to a Future of its chart paths; cached charts are
+            resolved immediately and the rest are rendered in worker processes
+        """
+        cache_keys = {}
+        jobs = {}
+        misses = {}
+        for ticker, (data, ticker_dir) in requests.items():
+            cache_keys[ticker] = self.cache_key(data, ticker, ma_periods)
+            charts = self.load_cached_charts(cache_keys[ticker], ticker_dir)
+            
+            if charts is not None:
+                jobs[ticker] = Future()
+                jobs[ticker].set_result(charts)
+            else:
+                misses[ticker] = (data, ticker_dir)
+        
+        executor = None
+        if misses:
+            # Chart rendering is CPU-bound, so cache misses go to worker processes;
+            # all workers start on the first submit, so don't start more than needed
+            executor = ProcessPoolExecutor(max_workers=min(len(misses), os.cpu_count() or 1))
+            for ticker, (data, ticker_dir) in misses.items():
+                jobs[ticker] = executor.submit(render_charts, data, ticker, ticker_dir, ma_periods)
+        
+        try:
+            yield jobs
+        except BaseException:
+            # Don't wait for queued renders when the caller failed or was interrupted
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            raise
+        
+        if executor is not None:
+            executor.shutdown()
+        
+        for ticker, job in jobs.items():
+            if job.exception() is None:
+                self.cache_charts(cache_keys[ticker], job.result())
+        
+        # The cache is only an optimization, so failing to persist it is not an error
+        try:
+            self.save_cache_index()
+        except OSError:
+            pass
+
+    def render_all_charts(
         self,
         data: pd.DataFrame,
         ticker: str,
-        ticker_dir: Path
+        ticker_dir: Path,
+        ma_periods: tuple = DEFAULT_MA_PERIODS
     ) -> Dict[str, Path]:
-        """Generate and save all chart types for a ticker"""
+        """Render and save all chart types for a ticker, bypassing the cache"""
         charts = {}
         
         # Basic candlestick chart
@@ -130,8 +328,13 @@ class ChartGenerator:
             'candlestick'
         )
         
-        # Technical analysis chart
-        ta_fig = self.create_technical_analysis_chart(data, ticker)
+        # Technical analysis chart, reusing a copy of the candlestick figure
+        ta_fig = self.create_technical_analysis_chart(
+            data,
+            ticker,
+            ma_periods=ma_periods,
+            fig=copy.deepcopy(candlestick_fig)
+        )
         charts['technical'] = self.save_chart(
             ta_fig, 
             ticker, 
@@ -139,4 +342,20 @@ class ChartGenerator:
             'technical'
         )
         
-        return charts 
\ No newline at end of file
+        return charts 
+
+# Per-process generator used by render_charts, so worker processes build one
+# ChartGenerator each instead of receiving a pickled copy with every task
+_worker_chart_generator: Optional[ChartGenerator] = None
+
+def render_charts(
+    data: pd.DataFrame,
+    ticker: str,
+    ticker_dir: Path,
+    ma_periods: tuple = DEFAULT_MA_PERIODS
+) -> Dict[str, Path]:
+    """Render and save all chart types for a ticker; picklable entry point for process pools"""
+    global _worker_chart_generator
+    if _worker_chart_generator is None:
+        _worker_chart_generator = ChartGenerator()
+    return _worker_chart_generator.render_all_charts(data, ticker, ticker_dir, ma_periods)